@@ -1,12 +1,40 @@
 #!/usr/bin/env python3
 from abc import ABC, abstractmethod
-from typing import Any
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import count, islice, repeat
+from operator import itemgetter, mul, sub
+from time import perf_counter
+from typing import (
+    IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+)
+import errno
+import io
+import sys
+
+# bytes buffered before each write to a binary log sink
+WRITE_CHUNK = 1 << 16
+
+# validation keys remembered when cache_validation is enabled
+VALIDATION_CACHE_SIZE = 1024
+
+# native buffer formats accepted by the columnar numeric path
+INTEGER_FORMATS = frozenset("bBhHiIlLqQ")
+NUMERIC_FORMATS = INTEGER_FORMATS | frozenset("fd")
 
 
 # base class abstract ABC
 class DataProcessor(ABC):
     """Abstract base class for data processors."""
 
+    def __init__(self, cache_validation: bool = False) -> None:
+        # caller-supplied keys of batches that already passed validate()
+        self.validation_cache: Optional["OrderedDict[Any, None]"] = \
+            OrderedDict() if cache_validation else None
+        self.validation_stats = {"run": 0, "cached": 0, "trusted": 0}
+        self.reset()
+
     @abstractmethod
     def process(self, data: Any) -> str:
         """Process the input data and return the result."""
@@ -17,52 +45,405 @@ class DataProcessor(ABC):
         """Validate the input data."""
         pass
 
+# validation cache: skip validate() for batches already seen or trusted
+    def is_valid(
+        self, data: Any, *, trusted: bool = False, cache_key: Any = None
+    ) -> bool:
+        """Run validate() unless the batch is trusted or already cached.
+
+        `cache_key` is a hashable batch id + version chosen by the caller,
+        who must change it whenever the batch content changes; batches
+        without a key are always validated.
+        """
+        stats = self.validation_stats
+        if trusted:
+            stats["trusted"] += 1
+            return True
+        cache = self.validation_cache
+        if cache is not None and cache_key is not None \
+                and cache_key in cache:
+            cache.move_to_end(cache_key)
+            stats["cached"] += 1
+            return True
+        stats["run"] += 1
+        valid = self.validate(data)
+        if valid and cache is not None and cache_key is not None:
+            cache[cache_key] = None
+            if len(cache) > VALIDATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return valid
+
 # default method
     def format_output(self, result: str) -> str:
         """Format the output result."""
         return f"Output: {result}"
 
+# streaming protocol: feed() chunks, then finalize() for the summary
+    def reset(self) -> None:
+        """Clear the incremental state used by feed()/finalize()."""
+        pass
+
+    @abstractmethod
+    def feed(self, chunk: Any) -> None:
+        """Consume one chunk of a stream incrementally."""
+        pass
+
+    @abstractmethod
+    def finalize(self) -> str:
+        """Return the summary of every fed chunk and reset the state."""
+        pass
+
+    def process_stream(self, chunks: Iterable[Any]) -> str:
+        """Feed every chunk of an iterable and finalize."""
+        for chunk in chunks:
+            self.feed(chunk)
+        return self.finalize()
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split any iterable (e.g. an open file) into lists of `size` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def tokenize(texts: Iterable[str]) -> Iterator[str]:
+    """Lazily yield lower-cased whitespace-separated words."""
+    for text in texts:
+        for word in text.split():
+            yield word.lower()
+
+
+class WordIndex:
+    """Incremental word-frequency index that can be merged."""
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+
+    def add(self, texts: Iterable[str]) -> int:
+        """Tokenize texts, count their words and return how many."""
+        # zip stops on the exhausted tokenizer before drawing from the
+        # counter, so next(counter) is the token count; no list is built
+        counter = count()
+        self.counts.update(map(itemgetter(0), zip(tokenize(texts), counter)))
+        return next(counter)
+
+    def merge(self, other: "WordIndex") -> "WordIndex":
+        """Fold another index (e.g. from a worker) into this one."""
+        self.counts.update(other.counts)
+        return self
+
+    def top(self, k: int = 3) -> List[Tuple[str, int]]:
+        """Return the k most frequent words (heap-based)."""
+        return self.counts.most_common(k)
+
 
 class NumericProcessor(DataProcessor):
     """Concrete implementation for processing numeric data."""
 
-    def process(self, data: Any) -> str:
-        if not self.validate(data):
+    def process(
+        self, data: Any, *, trusted: bool = False, cache_key: Any = None
+    ) -> str:
+        if not isinstance(data, list):
+            return self.process_columnar(data)
+        if not self.is_valid(data, trusted=trusted, cache_key=cache_key):
             raise ValueError("Invalid data for NumericProcessor")
+        total = sum(data)
         processed_value = f"Processed {len(data)} values, \
-sum={sum(data)}, avg={sum(data)/len(data):.2f}"
+sum={total}, avg={total/len(data):.2f}"
         return str(processed_value)
 
     def validate(self, data: Any) -> bool:
         return isinstance(data, list) and all(isinstance(i, int) for i in data)
 
+    def validate_columnar(self, data: Any) -> bool:
+        """Check a typed buffer (array.array, NumPy array) by its dtype."""
+        try:
+            view = memoryview(data)
+        except TypeError:
+            return False
+        return view.ndim == 1 and view.format in NUMERIC_FORMATS
+
+    def columnar_stats(self, data: Any) -> Dict[str, Union[int, float]]:
+        """Compute count/sum/mean/min/max/variance over a typed buffer."""
+        if not self.validate_columnar(data):
+            raise ValueError("Invalid columnar data for NumericProcessor")
+        view = memoryview(data)
+        count = len(view)
+        if count == 0:
+            raise ValueError("Empty columnar data for NumericProcessor")
+        # one C-level unboxing, then C builtins only: no per-element bytecode
+        values = view.tolist()
+        total = sum(values)
+        mean = total / count
+        if view.format in INTEGER_FORMATS:
+            # exact in integer arithmetic, so no cancellation
+            squares = sum(map(mul, values, values))
+            variance = (count * squares - total * total) / (count * count)
+        else:
+            # second pass over deviations keeps floats stable
+            deviations = map(sub, values, repeat(mean))
+            variance = sum(map(pow, deviations, repeat(2))) / count
+        return {
+            "count": count,
+            "sum": total,
+            "mean": mean,
+            "min": min(values),
+            "max": max(values),
+            "variance": variance,
+        }
+
+    def process_columnar(self, data: Any) -> str:
+        """Process a typed buffer without per-element validation."""
+        if not self.validate_columnar(data):
+            raise ValueError("Invalid columnar data for NumericProcessor")
+        view = memoryview(data)
+        if len(view) == 0:
+            raise ValueError("Empty columnar data for NumericProcessor")
+        total = sum(view)
+        return f"Processed {len(view)} values, \
+sum={total}, avg={total/len(view):.2f}"
+
+    def reset(self) -> None:
+        self.stream_count = 0
+        self.stream_total: Union[int, float] = 0
+
+    def feed(self, chunk: Any) -> None:
+        if isinstance(chunk, list):
+            if not self.validate(chunk):
+                raise ValueError("Invalid data for NumericProcessor")
+        elif not self.validate_columnar(chunk):
+            raise ValueError("Invalid columnar data for NumericProcessor")
+        self.stream_count += len(chunk)
+        self.stream_total += sum(chunk)
+
+    def finalize(self) -> str:
+        count, total = self.stream_count, self.stream_total
+        self.reset()
+        if count == 0:
+            raise ValueError("No data fed to NumericProcessor")
+        return f"Processed {count} values, sum={total}, avg={total/count:.2f}"
+
 
 class TextProcessor(DataProcessor):
     """Concrete implementation for processing text data."""
 
-    def process(self, data: Any) -> str:
-        if not self.validate(data):
+    def process(
+        self, data: Any, *, trusted: bool = False, cache_key: Any = None
+    ) -> str:
+        if not self.is_valid(data, trusted=trusted, cache_key=cache_key):
             raise ValueError("Invalid data for TextProcessor")
-        processed_value = f"Processed {len(''.join(data))} characters, \
-{len(data)} words"
+        words = sum(map(len, map(str.split, data)))
+        processed_value = f"Processed {sum(map(len, data))} characters, \
+{words} words"
         return processed_value
 
+    def build_index(
+        self, data: Any, *, trusted: bool = False, cache_key: Any = None
+    ) -> WordIndex:
+        """Build a word-frequency index for one batch."""
+        if not self.is_valid(data, trusted=trusted, cache_key=cache_key):
+            raise ValueError("Invalid data for TextProcessor")
+        index = WordIndex()
+        index.add(data)
+        return index
+
     def validate(self, data: Any) -> bool:
         return isinstance(data, list) and all(isinstance(i, str) for i in data)
 
+    def reset(self) -> None:
+        self.stream_chars = 0
+        self.stream_words = 0
+        self.stream_index = WordIndex()
+
+    def feed(self, chunk: Any) -> None:
+        if not self.validate(chunk):
+            raise ValueError("Invalid data for TextProcessor")
+        self.stream_chars += sum(map(len, chunk))
+        self.stream_words += self.stream_index.add(chunk)
+
+    def finalize(self) -> str:
+        chars, words = self.stream_chars, self.stream_words
+        top = ", ".join(f"{w}={n}" for w, n in self.stream_index.top())
+        self.reset()
+        return f"Processed {chars} characters, {words} words (top: {top})"
+
 
 class LogProcessor(DataProcessor):
     """Concrete implementation for processing log data."""
 
-    def process(self, data: Any) -> str:
-        if not self.validate(data):
+    def process(
+        self,
+        data: Any,
+        *,
+        sink: Optional[IO[Any]] = None,
+        trusted: bool = False,
+        cache_key: Any = None,
+    ) -> str:
+        if not self.is_valid(data, trusted=trusted, cache_key=cache_key):
             raise ValueError("Invalid data for LogProcessor")
+        if sink is not None:
+            return self.write_output(data, sink)
         processed_value = "\n".join(data)
         return processed_value
 
+    def write_output(self, data: List[str], sink: IO[Any]) -> str:
+        """Write entries straight to a file-like sink, return a summary."""
+        binary = isinstance(sink, (io.RawIOBase, io.BufferedIOBase)) \
+            or "b" in getattr(sink, "mode", "")
+        size = 0
+        if binary:
+            buffer = bytearray()
+            for entry in data:
+                buffer += entry.encode()
+                buffer += b"\n"
+                if len(buffer) >= WRITE_CHUNK:
+                    size += self._write_all(sink, buffer)
+                    buffer.clear()
+            size += self._write_all(sink, buffer)
+            unit = "bytes"
+        else:
+            sink.writelines(self._with_newlines(data))
+            size = sum(map(len, data)) + len(data)
+            unit = "characters"
+        return f"Wrote {len(data)} log entries, {size} {unit}"
+
+    @staticmethod
+    def _write_all(sink: IO[Any], buffer: bytearray) -> int:
+        """Write a whole buffer, looping on short raw writes.
+
+        A raw non-blocking sink returns None when nothing could be
+        written; that raises BlockingIOError (characters_written counts
+        this buffer's bytes) instead of dropping the rest of it.
+        """
+        view = memoryview(buffer)
+        done = 0
+        try:
+            while done < len(view):
+                written = sink.write(view[done:])
+                if written is None:
+                    raise BlockingIOError(
+                        errno.EAGAIN, "log sink would block", done
+                    )
+                done += written
+        finally:
+            view.release()
+        return done
+
+    @staticmethod
+    def _with_newlines(data: List[str]) -> Iterator[str]:
+        for entry in data:
+            yield entry
+            yield "\n"
+
     def validate(self, data: Any) -> bool:
         return isinstance(data, list) and all(isinstance(i, str) for i in data)
 
+    def reset(self) -> None:
+        self.stream_entries = 0
+        self.stream_levels: Dict[str, int] = {}
+
+    def feed(self, chunk: Any) -> None:
+        if not self.validate(chunk):
+            raise ValueError("Invalid data for LogProcessor")
+        levels = self.stream_levels
+        for entry in chunk:
+            level = entry.partition(":")[0].strip() if ":" in entry else "-"
+            levels[level] = levels.get(level, 0) + 1
+        self.stream_entries += len(chunk)
+
+    def finalize(self) -> str:
+        entries, levels = self.stream_entries, self.stream_levels
+        self.reset()
+        summary = ", ".join(f"{k}={v}" for k, v in levels.items())
+        return f"Processed {entries} log entries ({summary})"
+
+
+# (processor name, item count, result or error message, ok, busy seconds)
+JobResult = Tuple[str, int, str, bool, float]
+
+
+def _run_jobs(jobs: List[Tuple[DataProcessor, Any]]) -> List[JobResult]:
+    """Worker entry point: run a group of (processor, batch) pairs."""
+    results: List[JobResult] = []
+    for processor, batch in jobs:
+        name = processor.__class__.__name__
+        start = perf_counter()
+        try:
+            output, ok = processor.process(batch), True
+        except ValueError as e:
+            output, ok = str(e), False
+        results.append((name, len(batch), output, ok, perf_counter() - start))
+    return results
+
+
+class ProcessorPool:
+    """Fan (processor, batch) pairs out across worker processes."""
+
+    def __init__(
+        self, max_workers: Optional[int] = None, min_task_size: int = 10_000
+    ) -> None:
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        self.min_task_size = min_task_size
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def map(self, jobs: Iterable[Tuple[DataProcessor, Any]]) -> List[str]:
+        """Run every job and return the results in submission order.
+
+        Small batches are grouped into one task until they hold at least
+        `min_task_size` items, so pickling cost is paid per group.
+        """
+        futures: List[Future] = []
+        group: List[Tuple[DataProcessor, Any]] = []
+        size = 0
+        for processor, batch in jobs:
+            group.append((processor, batch))
+            size += len(batch)
+            if size >= self.min_task_size:
+                futures.append(self.executor.submit(_run_jobs, group))
+                group, size = [], 0
+        if group:
+            futures.append(self.executor.submit(_run_jobs, group))
+        results: List[str] = []
+        for future in futures:
+            for name, count, output, ok, busy in future.result():
+                self._record(name, count, busy)
+                if not ok:
+                    raise ValueError(output)
+                results.append(output)
+        return results
+
+    def _record(self, name: str, count: int, busy: float) -> None:
+        stats = self.stats.setdefault(
+            name, {"calls": 0, "items": 0, "busy_s": 0.0}
+        )
+        stats["calls"] += 1
+        stats["items"] += count
+        stats["busy_s"] += busy
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-processor calls, items, busy time and items/second."""
+        return {
+            name: {
+                **stats,
+                "items_per_s": stats["items"] / stats["busy_s"]
+                if stats["busy_s"] else 0.0,
+            }
+            for name, stats in self.stats.items()
+        }
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+    def __enter__(self) -> "ProcessorPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
 
 def main() -> None:
     print("=== CODE NEXUS - DATA PROCESSOR FOUNDATION ===\n")
@@ -125,5 +506,49 @@ def main() -> None:
             print(f"Error processing data with {proc.__class__.__name__}: {e}")
 
 
+def benchmark(size: int = 1_000_000) -> None:
+    """Compare the list path against the columnar path."""
+    print(f"=== NumericProcessor benchmark ({size} values) ===")
+    processor = NumericProcessor()
+    values = list(range(size))
+    column = array("q", values)
+    start = perf_counter()
+    processor.process(values)
+    print(f"list path:      {perf_counter() - start:.4f}s (sum/avg)")
+    start = perf_counter()
+    processor.process(column)
+    print(f"columnar path:  {perf_counter() - start:.4f}s (sum/avg)")
+    start = perf_counter()
+    processor.validate(values)
+    total = sum(values)
+    mean = total / size
+    sum((value - mean) ** 2 for value in values)
+    min(values), max(values)
+    print(f"list stats:     {perf_counter() - start:.4f}s (full stats)")
+    start = perf_counter()
+    processor.columnar_stats(column)
+    print(f"columnar stats: {perf_counter() - start:.4f}s (full stats)")
+
+    print(f"\n=== ProcessorPool benchmark ({size} items per job) ===")
+    jobs: List[Tuple[DataProcessor, Any]] = [
+        (NumericProcessor(), values),
+        (TextProcessor(), ["nexus"] * size),
+        (LogProcessor(), ["Info: System started"] * size),
+    ] * 2
+    start = perf_counter()
+    for proc, data in jobs:
+        proc.process(data)
+    print(f"serial: {perf_counter() - start:.4f}s")
+    with ProcessorPool() as pool:
+        start = perf_counter()
+        pool.map(jobs)
+        print(f"pool:   {perf_counter() - start:.4f}s")
+        for name, stats in pool.get_stats().items():
+            print(f"  {name}: {stats['items_per_s']:.0f} items/s")
+
+
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()
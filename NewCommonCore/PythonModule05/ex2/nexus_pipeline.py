@@ -1,11 +1,32 @@
 #!/usr/bin/env python3
 
-from typing import Protocol, Any, Union, List
+from typing import (
+    Protocol, Any, Union, List, Dict, Iterable, Iterator, Optional, Callable, Deque
+)
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+import codecs
+import csv
+import io
 import json
+import math
+import mmap
+import os
+import queue
+import random
+import re
+import sys
+import threading
 import time
+import tracemalloc
 from datetime import datetime
 
+WHITESPACE = re.compile(r"[ \t\r\n]*")
+
 
 class ProcessingStage(Protocol):
     """Protocol for data processing stages using duck typing."""
@@ -15,22 +36,131 @@ class ProcessingStage(Protocol):
         ...
 
 
+# Record flags, set by the stage that handled the record
+VALIDATED = 1
+ENRICHED = 2
+FORMATTED = 4
+
+
+class Record:
+    """Lightweight envelope carried through every stage of a pipeline.
+
+    Stages set flag bits on the same envelope instead of wrapping the
+    record in a new dict, so a record allocates one envelope in total.
+    """
+
+    __slots__ = ("data", "flags", "timestamp")
+
+    def __init__(self, data: Any, flags: int = 0, timestamp: int = 0) -> None:
+        """Initialize the envelope around `data`."""
+        self.data = data
+        self.flags = flags
+        self.timestamp = timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict view of the record and its flags."""
+        return {
+            "data": self.data,
+            "validated": bool(self.flags & VALIDATED),
+            "enriched": bool(self.flags & ENRICHED),
+            "formatted": bool(self.flags & FORMATTED),
+            "timestamp": self.timestamp,
+        }
+
+    def __repr__(self) -> str:
+        """Readable representation of the record."""
+        return f"Record({self.to_dict()})"
+
+
 class InputStage:
     """Stage for input validation and parsing."""
 
     def process(self, data: Any) -> Any:
         """Validate and parse input data."""
-        return {"validated": True, "data": data}
+        if isinstance(data, Record):
+            data.flags |= VALIDATED
+            return data
+        return Record(data, VALIDATED)
+
+
+def iso_timestamp(timestamp_ns: int) -> str:
+    """Format an integer nanosecond timestamp as local ISO 8601."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+class CoarseClock:
+    """Nanosecond wall clock cached in `now_ns` and refreshed by ticks.
+
+    A daemon thread ticks every `interval` seconds, so the cached time is
+    never older than that and reading it costs no system call. Call
+    tick() to refresh it right away, and stop() to end the thread.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Initialize the clock and start ticking every `interval` seconds."""
+        self.interval = interval
+        self.now_ns = time.time_ns()
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.start()
+
+    def __call__(self) -> int:
+        """Return the cached time."""
+        return self.now_ns
+
+    def tick(self) -> None:
+        """Refresh the cached time now."""
+        self.now_ns = time.time_ns()
+
+    def start(self) -> None:
+        """Tick every `interval` seconds in a daemon thread."""
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop the ticking thread."""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            self.tick()
 
 
 class TransformStage:
-    """Stage for data transformation and enrichment."""
+    """Stage for data transformation and enrichment.
+
+    Enrichment lives on the Record envelope only: the payload, a single
+    dict or a whole list batch, is never modified. Batch paths pass each
+    batch as one Record, so a batch is stamped with one clock read.
+    Timestamps are integer nanoseconds (see iso_timestamp); pass a
+    CoarseClock to read its cached time instead of calling a clock for
+    every record.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.time_ns) -> None:
+        """Initialize the stage with the clock used for timestamps."""
+        self.clock = clock
+        if isinstance(clock, CoarseClock):
+            self.process = self._process_cached
 
     def process(self, data: Any) -> Any:
         """Transform and enrich data."""
-        if isinstance(data, dict) and "data" in data:
-            data["enriched"] = True
-            data["timestamp"] = datetime.now().isoformat()
+        if isinstance(data, Record):
+            data.flags |= ENRICHED
+            data.timestamp = self.clock()
+        return data
+
+    def _process_cached(self, data: Any) -> Any:
+        """process() reading a CoarseClock's cached time as an attribute."""
+        if isinstance(data, Record):
+            data.flags |= ENRICHED
+            data.timestamp = self.clock.now_ns
         return data
 
 
@@ -39,7 +169,170 @@ class OutputStage:
 
     def process(self, data: Any) -> Any:
         """Format and deliver output."""
-        return {"formatted": True, "output": data}
+        if isinstance(data, Record):
+            data.flags |= FORMATTED
+            return data
+        return Record(data, FORMATTED)
+
+
+class _StageFailure:
+    """Marker carrying an exception raised by a stage down the pipeline."""
+
+    def __init__(self, stage: str, error: Exception) -> None:
+        self.stage = stage
+        self.error = error
+
+
+class PipelinedExecutor:
+    """Run each stage in its own thread, connected by bounded queues.
+
+    Stages overlap across items: while OutputStage formats item N,
+    TransformStage can already enrich item N+1. Item order is kept.
+    """
+
+    _END = object()
+
+    def __init__(self, stages: List[ProcessingStage], queue_size: int = 64) -> None:
+        """Initialize the executor for the given stages."""
+        self.stages = stages
+        self.queue_size = queue_size
+        self.metrics: Dict[str, Dict[str, float]] = {}
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """Push every item through all stages and collect the results."""
+        queues: List[queue.Queue] = [
+            queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+        self.metrics = {}
+        workers = []
+        for index, stage in enumerate(self.stages):
+            name = f"{index + 1}:{stage.__class__.__name__}"
+            stats = {"items": 0, "busy_s": 0.0, "wait_s": 0.0, "blocked_s": 0.0}
+            self.metrics[name] = stats
+            worker = threading.Thread(
+                target=self._work,
+                args=(stage, name, stats, queues[index], queues[index + 1]),
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+
+        feeder = threading.Thread(target=self._feed, args=(items, queues[0]), daemon=True)
+        feeder.start()
+
+        results: List[Any] = []
+        failure: Optional[_StageFailure] = None
+        output = queues[-1]
+        while True:
+            item = output.get()
+            if item is self._END:
+                break
+            if isinstance(item, _StageFailure):
+                failure = failure or item
+                continue
+            results.append(item)
+        feeder.join()
+        for worker in workers:
+            worker.join()
+        if failure is not None:
+            raise failure.error
+        return results
+
+    def _feed(self, items: Iterable[Any], first: queue.Queue) -> None:
+        """Feed the first queue from the input iterable."""
+        try:
+            for item in items:
+                first.put(item)
+        except Exception as e:
+            first.put(_StageFailure("input", e))
+        first.put(self._END)
+
+    def _work(
+        self,
+        stage: ProcessingStage,
+        name: str,
+        stats: Dict[str, float],
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+    ) -> None:
+        """Worker loop of one stage.
+
+        wait_s is time starved on the inbox, blocked_s is time stalled on a
+        full outbox (backpressure from the next stage).
+        """
+        clock = time.perf_counter
+        while True:
+            waited = clock()
+            item = inbox.get()
+            started = clock()
+            stats["wait_s"] += started - waited
+            if item is self._END:
+                outbox.put(item)
+                return
+            if not isinstance(item, _StageFailure):
+                try:
+                    item = stage.process(item)
+                except Exception as e:
+                    item = _StageFailure(name, e)
+                stats["items"] += 1
+                stats["busy_s"] += clock() - started
+            blocked = clock()
+            outbox.put(item)
+            stats["blocked_s"] += clock() - blocked
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage items, busy time, inbox wait, outbox stall and throughput."""
+        return {
+            name: {
+                **stats,
+                "items_per_s": stats["items"] / stats["busy_s"] if stats["busy_s"] else 0.0,
+            }
+            for name, stats in self.metrics.items()
+        }
+
+
+def fuse_stages(stages: List[ProcessingStage]) -> Callable[[Any], Any]:
+    """Generate one straight-line function calling every stage in turn.
+
+    The stage methods are bound as default arguments, so the fused
+    function has no loop and no attribute lookups per record.
+    """
+    names = [f"stage_{index}" for index in range(len(stages))]
+    body = "".join(f"    data = {name}(data)\n" for name in names)
+    params = "".join(f", {name}={name}" for name in names)
+    source = f"def fused(data{params}):\n{body}    return data\n"
+    namespace: Dict[str, Any] = {
+        name: stage.process for name, stage in zip(names, stages)
+    }
+    exec(source, namespace)
+    return namespace["fused"]
+
+
+class StageList(list):
+    """Stages of one pipeline; any in-place change drops its compiled form."""
+
+    def __init__(self, stages: Iterable[ProcessingStage], owner: "ProcessingPipeline") -> None:
+        """Initialize the list with its stages and the owning pipeline."""
+        super().__init__(stages)
+        self.owner = owner
+
+
+def _invalidating(name: str) -> Callable[..., Any]:
+    """Wrap a list mutator so it clears the owner's compiled form first."""
+    method = getattr(list, name)
+
+    def mutate(self: StageList, *args: Any, **kwargs: Any) -> Any:
+        self.owner.compiled = None
+        return method(self, *args, **kwargs)
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "append", "extend", "insert", "pop", "remove", "clear", "sort",
+    "reverse", "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(StageList, _name, _invalidating(_name))
 
 
 class ProcessingPipeline(ABC):
@@ -48,9 +341,22 @@ class ProcessingPipeline(ABC):
     def __init__(self, pipeline_id: str, stages: List[ProcessingStage] = None) -> None:
         """Initialize pipeline with stages."""
         self.pipeline_id = pipeline_id
+        self.compiled: Optional[Callable[[Any], Any]] = None
         self.stages = stages or []
         self.processed_count = 0
         self.start_time = None
+        self.stage_metrics: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def stages(self) -> List[ProcessingStage]:
+        """The pipeline's stages, in order."""
+        return self._stages
+
+    @stages.setter
+    def stages(self, stages: Iterable[ProcessingStage]) -> None:
+        """Replace the stages, dropping the compiled form."""
+        self._stages = StageList(stages, self)
+        self.compiled = None
 
     @abstractmethod
     def process(self, data: Any) -> Union[str, Any]:
@@ -61,13 +367,77 @@ class ProcessingPipeline(ABC):
         """Add a stage to the pipeline."""
         self.stages.append(stage)
 
+    def compile(self, fallback: bool = False) -> None:
+        """Fuse every stage into one generated callable.
+
+        add_stage(), assigning `self.stages` or changing it in place all
+        drop the compiled form, so the pipeline falls back to the
+        interpreted chain until compile() is called again.
+        `fallback=True` drops the compiled form, e.g. for debugging.
+        """
+        if fallback or not self.stages:
+            self.compiled = None
+            return
+        self.compiled = fuse_stages(self.stages)
+
     def _execute_stages(self, data: Any) -> Any:
         """Execute all stages in sequence."""
+        if self.compiled is not None:
+            return self.compiled(data)
         result = data
         for stage in self.stages:
             result = stage.process(result)
         return result
 
+    def parse(self, item: Any) -> Any:
+        """Turn one raw item into a record before the stages run."""
+        return item
+
+    def accept(self, result: Any) -> Any:
+        """Account for a record once it has passed every stage."""
+        return result
+
+    def execute_isolated(
+        self, items: Iterable[Any], on_error: Callable[[Any, str, Exception], None]
+    ) -> List[Any]:
+        """Execute the stages per item; a failing item goes to `on_error`.
+
+        `on_error` receives the raw item, the failing stage name and the
+        exception, and the rest of the batch carries on. accept() runs
+        last, so a failing item leaves no trace in the pipeline's state.
+        """
+        stages = [
+            (f"{index + 1}:{stage.__class__.__name__}", stage.process)
+            for index, stage in enumerate(self.stages)
+        ]
+        stages.append((f"{len(stages) + 1}:accept", self.accept))
+        results: List[Any] = []
+        for item in items:
+            name = "0:parse"
+            try:
+                result = self.parse(item)
+                for name, process in stages:
+                    result = process(result)
+            except Exception as e:
+                on_error(item, name, e)
+                continue
+            results.append(result)
+        self.processed_count += len(results)
+        return results
+
+    def execute_batch(self, items: Iterable[Any]) -> List[Any]:
+        """Execute all stages over many items with one call per item."""
+        run = self.compiled or self._execute_stages
+        return [run(item) for item in items]
+
+    def run_pipelined(self, items: Iterable[Any], queue_size: int = 64) -> List[Any]:
+        """Execute the stages concurrently over many items."""
+        executor = PipelinedExecutor(self.stages, queue_size)
+        results = executor.run(items)
+        self.processed_count += len(results)
+        self.stage_metrics = executor.get_metrics()
+        return results
+
 
 class JSONAdapter(ProcessingPipeline):
     """Adapter for JSON data processing."""
@@ -77,12 +447,18 @@ class JSONAdapter(ProcessingPipeline):
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
+        self.decoder = json.JSONDecoder()
+        self.batch_size = 1024
+
+    def parse(self, item: Any) -> Any:
+        """Decode a JSON document; other items pass through."""
+        return self.decoder.decode(item) if isinstance(item, str) else item
 
     def process(self, data: Any) -> Union[str, Any]:
         """Process JSON data through pipeline."""
         try:
             if isinstance(data, str):
-                parsed = json.loads(data)
+                parsed = self.decoder.decode(data)
             else:
                 parsed = data
 
@@ -99,10 +475,76 @@ class JSONAdapter(ProcessingPipeline):
                     status = "Alert"
                 return f"Processed temperature reading: {temp}°{unit} ({status})"
 
+            if isinstance(result, Record):
+                return str(result.to_dict())
             return str(result)
         except Exception as e:
             raise ValueError(f"JSON processing error: {e}")
 
+    def process_ndjson(self, source: Any, block_size: int = 1 << 20) -> str:
+        """Process newline-delimited JSON in record batches."""
+        try:
+            records = self.iter_ndjson(source, block_size)
+            count = 0
+            while True:
+                batch = list(islice(records, self.batch_size))
+                if not batch:
+                    break
+                self._execute_stages(batch)
+                count += len(batch)
+            self.processed_count += count
+            return f"Processed {count} NDJSON records"
+        except Exception as e:
+            raise ValueError(f"NDJSON processing error: {e}")
+
+    def iter_ndjson(self, source: Any, block_size: int = 1 << 20) -> Iterator[Any]:
+        """Decode NDJSON records lazily from a string, bytes, file or Path.
+
+        Records are decoded in place with raw_decode at their offset in
+        the block, so lines are never sliced out of it.
+        """
+        decode = self.decoder.raw_decode
+        skip = WHITESPACE.match
+        for block in self._ndjson_blocks(source, block_size):
+            pos, end = 0, len(block)
+            while True:
+                pos = skip(block, pos).end()
+                if pos >= end:
+                    break
+                record, pos = decode(block, pos)
+                yield record
+
+    @staticmethod
+    def _ndjson_blocks(source: Any, block_size: int) -> Iterator[str]:
+        """Yield large text blocks that end on a line boundary."""
+        if isinstance(source, str):
+            yield source
+            return
+        if isinstance(source, (bytes, bytearray)):
+            yield source.decode()
+            return
+        stream = open(source, "r") if isinstance(source, Path) else source
+        try:
+            tail = ""
+            utf8 = codecs.getincrementaldecoder("utf-8")()
+            while True:
+                chunk = stream.read(block_size)
+                if not chunk:
+                    break
+                if isinstance(chunk, bytes):
+                    chunk = utf8.decode(chunk)
+                cut = chunk.rfind("\n") + 1
+                if cut == 0:
+                    tail += chunk
+                    continue
+                yield tail + chunk[:cut] if tail else chunk[:cut]
+                tail = chunk[cut:]
+            if tail:
+                yield tail
+        finally:
+            if stream is not source:
+                stream.close()
+
 
 class CSVAdapter(ProcessingPipeline):
     """Adapter for CSV data processing."""
@@ -112,39 +554,158 @@ class CSVAdapter(ProcessingPipeline):
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
+        self.batch_size = 1024
+        self.rows_per_sec = 0.0
+
+    def parse(self, item: Any) -> Any:
+        """Parse one CSV line into its fields; other items pass through."""
+        if not isinstance(item, str):
+            return item
+        rows = list(csv.reader(io.StringIO(item), strict=True))
+        if len(rows) != 1:
+            raise ValueError(f"Expected one CSV row, got {len(rows)}")
+        return rows[0]
 
     def process(self, data: Any) -> Union[str, Any]:
         """Process CSV data through pipeline."""
         try:
-            lines = data.split("\n") if isinstance(data, str) else [str(data)]
-            self.processed_count += len(lines)
-
-            result = self._execute_stages(lines[0] if lines else data)
+            before = self.processed_count
+            start = time.perf_counter()
+            for _ in self.stream(data):
+                pass
+            elapsed = time.perf_counter() - start
+            rows = self.processed_count - before
+            self.rows_per_sec = rows / elapsed if elapsed else 0.0
 
-            return f"User activity logged: {len(lines)} actions processed"
+            return f"User activity logged: {rows} actions processed"
         except Exception as e:
             raise ValueError(f"CSV processing error: {e}")
 
+    def stream(self, data: Any) -> Iterator[Any]:
+        """Lazily push row batches of `batch_size` rows through the stages."""
+        rows = self.iter_rows(data)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return
+            self.processed_count += len(batch)
+            yield self._execute_stages(batch)
+
+    @staticmethod
+    def iter_rows(data: Any) -> Iterator[List[str]]:
+        """Iterate CSV rows from a string, a file object or a Path."""
+        if isinstance(data, str):
+            yield from csv.reader(io.StringIO(data))
+        elif isinstance(data, Path):
+            with open(data, "rb") as f:
+                if f.seek(0, io.SEEK_END) == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    lines = (line.decode() for line in iter(mm.readline, b""))
+                    yield from csv.reader(lines)
+        elif hasattr(data, "read"):
+            yield from csv.reader(data)
+        else:
+            yield [str(data)]
+
+
+class RunningStats:
+    """One-pass mean/variance (Welford) with min and max."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values: Iterable[float]) -> None:
+        """Fold new values into the statistics."""
+        count, mean, m2 = self.count, self.mean, self.m2
+        low, high = self.min, self.max
+        for value in values:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+        self.count, self.mean, self.m2 = count, mean, m2
+        self.min, self.max = low, high
+
+    @property
+    def variance(self) -> float:
+        """Population variance of every value seen."""
+        return self.m2 / self.count if self.count else 0.0
+
+
+class PercentileSketch:
+    """Fixed-size reservoir sample giving approximate percentiles."""
+
+    def __init__(self, size: int = 1024) -> None:
+        """Initialize an empty reservoir of `size` samples."""
+        self.size = size
+        self.seen = 0
+        self.samples: List[float] = []
+
+    def update(self, values: Iterable[float]) -> None:
+        """Sample new values into the reservoir (Algorithm R)."""
+        samples, size = self.samples, self.size
+        for value in values:
+            self.seen += 1
+            if len(samples) < size:
+                samples.append(value)
+            else:
+                slot = random.randrange(self.seen)
+                if slot < size:
+                    samples[slot] = value
+
+    def percentile(self, q: float) -> float:
+        """Approximate nearest-rank percentile of every value seen."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
 
 class StreamAdapter(ProcessingPipeline):
-    """Adapter for streaming data processing."""
+    """Adapter for streaming data processing.
 
-    def __init__(self, pipeline_id: str) -> None:
+    Pass `stats` (and `sketch`) to share cumulative statistics between
+    adapters, e.g. every pooled instance of a manager.
+    """
+
+    def __init__(
+        self,
+        pipeline_id: str,
+        sketch_size: int = 0,
+        stats: Optional[RunningStats] = None,
+        sketch: Optional[PercentileSketch] = None,
+    ) -> None:
         super().__init__(pipeline_id)
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
+        self.stats = stats if stats is not None else RunningStats()
+        if sketch is None and sketch_size:
+            sketch = PercentileSketch(sketch_size)
+        self.sketch = sketch
 
     def process(self, data: Any) -> Union[str, Any]:
         """Process stream data through pipeline."""
         try:
-            # Simulate stream processing
             if isinstance(data, dict) and "readings" in data:
                 readings = data["readings"]
-                avg_temp = 22.1  # Fixed average for consistent output
-                self.processed_count += len(readings)
+                self._check(readings)
+                avg_temp = sum(readings) / len(readings) if readings else 0.0
 
                 result = self._execute_stages(data)
+                self.accept(result)
+                self.processed_count += len(readings)
 
                 return (
                     f"Stream summary: {len(readings)} readings, avg: {avg_temp:.1f}°C"
@@ -154,52 +715,543 @@ class StreamAdapter(ProcessingPipeline):
         except Exception as e:
             raise ValueError(f"Stream processing error: {e}")
 
+    def parse(self, item: Any) -> Any:
+        """Check the readings of a {"readings": [...]} item."""
+        if isinstance(item, dict) and "readings" in item:
+            self._check(item["readings"])
+        return item
+
+    def accept(self, result: Any) -> Any:
+        """Fold the readings of a fully processed item into the statistics."""
+        data = result.data if isinstance(result, Record) else result
+        if isinstance(data, dict) and "readings" in data:
+            readings = data["readings"]
+            self.stats.update(readings)
+            if self.sketch is not None:
+                self.sketch.update(readings)
+        return result
+
+    @staticmethod
+    def _check(readings: List[float]) -> None:
+        """Raise TypeError unless every reading is a number."""
+        for value in readings:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(f"Non-numeric reading: {value!r}")
+
+    def get_summary(self) -> Dict[str, float]:
+        """Cumulative statistics over every reading processed so far."""
+        stats = self.stats
+        summary = {
+            "count": stats.count,
+            "mean": stats.mean,
+            "stddev": math.sqrt(stats.variance),
+            "min": stats.min if stats.count else 0.0,
+            "max": stats.max if stats.count else 0.0,
+        }
+        if self.sketch is not None:
+            summary["p50"] = self.sketch.percentile(50)
+            summary["p95"] = self.sketch.percentile(95)
+        return summary
+
+
+class PipelinePool:
+    """Pool of idle pipelines keyed by type, with LRU eviction."""
+
+    def __init__(
+        self, factory: Callable[[str, str], ProcessingPipeline], max_idle: int = 16
+    ) -> None:
+        """Initialize the pool with a pipeline factory and an idle cap."""
+        self.factory = factory
+        self.max_idle = max_idle
+        self.idle: Dict[str, Deque[ProcessingPipeline]] = {}
+        self.lru: "OrderedDict[int, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, pipeline_type: str) -> ProcessingPipeline:
+        """Reuse the most recently released pipeline of a type, or build one."""
+        idle = self.idle.get(pipeline_type)
+        if idle:
+            pipeline = idle.pop()
+            del self.lru[id(pipeline)]
+            self.hits += 1
+            return pipeline
+        self.misses += 1
+        return self.factory(pipeline_type, f"{pipeline_type}_pipeline")
+
+    def release(self, pipeline_type: str, pipeline: ProcessingPipeline) -> None:
+        """Return a pipeline to the pool, evicting the least recently used."""
+        self.idle.setdefault(pipeline_type, deque()).append(pipeline)
+        self.lru[id(pipeline)] = pipeline_type
+        while len(self.lru) > self.max_idle:
+            _, oldest_type = self.lru.popitem(last=False)
+            self.idle[oldest_type].popleft()
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters plus the idle pipeline count."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "idle": len(self.lru),
+        }
+
+
+def _run_chain(pipeline_types: List[str], records: List[Any]) -> Dict[str, Any]:
+    """Worker entry point: run records through a fresh PipelineChain."""
+    chain = PipelineChain(pipeline_types)
+    results = chain.run(records)
+    return {"results": results, "stage_ns": chain.stage_ns}
+
+
+class PipelineChain:
+    """Compose pipelines A -> B -> C and time every stage.
+
+    Each record goes through A's parse hook, stages and accept hook,
+    then B's, and so on, so every pipeline applies its own per-record
+    logic. Stage time is measured with perf_counter_ns; efficiency is
+    the share of wall-clock time actually spent inside stages.
+    """
+
+    def __init__(self, pipeline_types: List[str]) -> None:
+        """Build one pipeline per type, in chain order."""
+        self.pipeline_types = pipeline_types
+        self.pipelines = [
+            NexusManager._build_pipeline(kind, f"{kind}_chain_{index}")
+            for index, kind in enumerate(pipeline_types)
+        ]
+        self.stage_ns: Dict[str, int] = {}
+        self.wall_ns = 0
+        self.records = 0
+        self.workers = 1
+
+    def run(self, records: Iterable[Any]) -> List[Any]:
+        """Push every record through the whole chain in this process."""
+        stages = []
+        for pipeline in self.pipelines:
+            stages.append((f"{pipeline.pipeline_id}:parse", pipeline.parse))
+            stages.extend(
+                (f"{pipeline.pipeline_id}:{stage.__class__.__name__}", stage.process)
+                for stage in pipeline.stages
+            )
+            stages.append((f"{pipeline.pipeline_id}:accept", pipeline.accept))
+        busy = [0] * len(stages)
+        clock = time.perf_counter_ns
+        results: List[Any] = []
+        start = clock()
+        for record in records:
+            for index, (_, process) in enumerate(stages):
+                before = clock()
+                record = process(record)
+                busy[index] += clock() - before
+            results.append(record)
+        self.wall_ns = clock() - start
+        self.records = len(results)
+        self.workers = 1
+        self.stage_ns = {name: ns for (name, _), ns in zip(stages, busy)}
+        for pipeline in self.pipelines:
+            pipeline.processed_count += len(results)
+        return results
+
+    def run_parallel(self, records: List[Any], workers: int) -> List[Any]:
+        """Split records over `workers` processes, keeping their order."""
+        if workers <= 1:
+            return self.run(records)
+        step = -(-len(records) // workers) or 1
+        chunks = [records[i:i + step] for i in range(0, len(records), step)]
+        start = time.perf_counter_ns()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outputs = list(
+                executor.map(_run_chain, [self.pipeline_types] * len(chunks), chunks)
+            )
+        self.wall_ns = time.perf_counter_ns() - start
+        self.workers = workers
+        self.stage_ns = {}
+        results: List[Any] = []
+        for output in outputs:
+            results.extend(output["results"])
+            for name, ns in output["stage_ns"].items():
+                self.stage_ns[name] = self.stage_ns.get(name, 0) + ns
+        self.records = len(results)
+        return results
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Wall time, records/second and efficiency of the last run."""
+        wall_s = self.wall_ns / 1e9
+        busy_ns = sum(self.stage_ns.values())
+        capacity_ns = self.wall_ns * self.workers
+        return {
+            "records": self.records,
+            "wall_s": wall_s,
+            "records_per_s": self.records / wall_s if wall_s else 0.0,
+            "efficiency": 100 * busy_ns / capacity_ns if capacity_ns else 0.0,
+        }
+
+
+class DeadLetterQueue:
+    """Bounded queue of failed records, kept as NDJSON on disk.
+
+    Without a path the entries are kept in memory. Once `max_entries`
+    are queued, further failures are only counted in `dropped`. Records
+    that JSON cannot encode are stored as their repr with
+    `"replayable": False`, so they are kept for inspection but never
+    replayed as strings.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 10_000) -> None:
+        """Initialize the queue, counting entries already on disk."""
+        self.path = path
+        self.max_entries = max_entries
+        self.memory: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self.size = 0
+        if path is not None:
+            try:
+                with open(path, "r") as f:
+                    self.size = sum(1 for line in f if line.strip())
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def make_entry(
+        pipeline_type: str, record: Any, stage: str, error: Exception
+    ) -> Dict[str, Any]:
+        """Build the entry queued for one failed record."""
+        return {
+            "pipeline": pipeline_type,
+            "stage": stage,
+            "error": f"{error.__class__.__name__}: {error}",
+            "record": record,
+        }
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any]) -> str:
+        """One NDJSON line; unencodable records are marked not replayable."""
+        try:
+            return json.dumps(entry) + "\n"
+        except (TypeError, ValueError):
+            entry = {**entry, "record": repr(entry["record"]), "replayable": False}
+            return json.dumps(entry) + "\n"
+
+    def push(self, pipeline_type: str, record: Any, stage: str, error: Exception) -> None:
+        """Queue one failed record with the stage that rejected it."""
+        if self.size >= self.max_entries:
+            self.dropped += 1
+            return
+        entry = self.make_entry(pipeline_type, record, stage, error)
+        if self.path is None:
+            self.memory.append(entry)
+        else:
+            with open(self.path, "a") as f:
+                f.write(self._encode(entry))
+        self.size += 1
+
+    def peek(self) -> List[Dict[str, Any]]:
+        """Return every queued entry without removing it."""
+        if self.path is None:
+            return list(self.memory)
+        try:
+            with open(self.path, "r") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def replace(self, entries: List[Dict[str, Any]]) -> None:
+        """Atomically swap the queued entries for `entries`."""
+        if self.path is None:
+            self.memory = list(entries)
+        elif not entries:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+        else:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.writelines(self._encode(entry) for entry in entries)
+            os.replace(tmp_path, self.path)
+        self.size = len(entries)
+
+    def __len__(self) -> int:
+        """Number of queued entries."""
+        return self.size
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second up to `burst`."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` are available (inf if above the burst)."""
+        self._refill()
+        if tokens > self.burst or self.rate <= 0:
+            return math.inf
+        return max(0.0, (tokens - self.tokens) / self.rate)
+
+    def take(self, tokens: float = 1.0) -> None:
+        """Consume tokens, possibly reserving ahead of the refill."""
+        self._refill()
+        self.tokens -= tokens
+
+
+class AdmissionController:
+    """Throttle work to a global rate plus optional per-type quotas.
+
+    A call is admitted when both the global bucket and its type bucket
+    have enough tokens. Otherwise it waits up to `max_wait` seconds
+    (counted as queued) or is rejected. Tokens are reserved under the
+    lock and the wait happens outside it, so a queued call does not
+    hold up calls of other types.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        quotas: Optional[Dict[str, float]] = None,
+        max_wait: float = 0.0,
+    ) -> None:
+        """Initialize the global bucket and one bucket per quota."""
+        self.bucket = TokenBucket(rate)
+        self.quotas = {kind: TokenBucket(quota) for kind, quota in (quotas or {}).items()}
+        self.max_wait = max_wait
+        self.lock = threading.Lock()
+        self.admitted = 0
+        self.rejected = 0
+        self.queued = 0
+
+    def _buckets(self, pipeline_type: str) -> List[TokenBucket]:
+        """The global bucket plus the type's quota bucket, if any."""
+        buckets = [self.bucket]
+        if pipeline_type in self.quotas:
+            buckets.append(self.quotas[pipeline_type])
+        return buckets
+
+    def slice_size(self, pipeline_type: str) -> int:
+        """Most tokens one admit() call for this type can ever be granted."""
+        return max(1, int(min(bucket.burst for bucket in self._buckets(pipeline_type))))
+
+    def admit(
+        self, pipeline_type: str, tokens: float = 1.0, max_wait: Optional[float] = None
+    ) -> bool:
+        """Return True once the call may proceed, False if rejected.
+
+        `max_wait` overrides the controller's limit for this call.
+        """
+        buckets = self._buckets(pipeline_type)
+        limit = self.max_wait if max_wait is None else max_wait
+        with self.lock:
+            wait = max(bucket.wait_time(tokens) for bucket in buckets)
+            if wait == math.inf or wait > limit:
+                self.rejected += 1
+                return False
+            # reserve now; the buckets go negative until the wait is over
+            for bucket in buckets:
+                bucket.take(tokens)
+            self.admitted += 1
+            if wait > 0:
+                self.queued += 1
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Admitted, rejected and queued counts."""
+        return {"admitted": self.admitted, "rejected": self.rejected, "queued": self.queued}
+
 
 class NexusManager:
     """Manager orchestrating multiple pipelines polymorphically."""
 
-    def __init__(self, capacity: int = 1000) -> None:
+    def __init__(
+        self,
+        capacity: int = 1000,
+        max_idle_pipelines: int = 16,
+        dlq_path: Optional[str] = None,
+        quotas: Optional[Dict[str, float]] = None,
+        max_wait: float = 0.0,
+    ) -> None:
         """Initialize the Nexus Manager."""
         self.capacity = capacity
+        self.admission = AdmissionController(capacity, quotas, max_wait)
         self.pipelines: List[ProcessingPipeline] = []
+        # per-type aggregates outlive whichever pooled adapter is handed out
+        self.stream_stats = RunningStats()
+        self.pool = PipelinePool(
+            partial(self._build_pipeline, stream_stats=self.stream_stats),
+            max_idle_pipelines,
+        )
+        self.dead_letters = DeadLetterQueue(dlq_path)
         self.start_time = time.time()
 
     def create_pipeline(
         self, pipeline_type: str, pipeline_id: str
     ) -> ProcessingPipeline:
         """Create a pipeline of the specified type."""
+        pipeline = self._build_pipeline(
+            pipeline_type, pipeline_id, stream_stats=self.stream_stats
+        )
+        self.pipelines.append(pipeline)
+        return pipeline
+
+    @staticmethod
+    def _build_pipeline(
+        pipeline_type: str,
+        pipeline_id: str,
+        stream_stats: Optional[RunningStats] = None,
+    ) -> ProcessingPipeline:
+        """Instantiate a pipeline of the specified type."""
         if pipeline_type == "json":
             pipeline = JSONAdapter(pipeline_id)
         elif pipeline_type == "csv":
             pipeline = CSVAdapter(pipeline_id)
         elif pipeline_type == "stream":
-            pipeline = StreamAdapter(pipeline_id)
+            pipeline = StreamAdapter(pipeline_id, stats=stream_stats)
         else:
             raise ValueError(f"Unknown pipeline type: {pipeline_type}")
-
-        self.pipelines.append(pipeline)
         return pipeline
 
+    def _admit(
+        self, pipeline_type: str, tokens: float = 1.0, max_wait: Optional[float] = None
+    ) -> None:
+        """Enforce the capacity and quotas, raising when over the limit."""
+        if not self.admission.admit(pipeline_type, tokens, max_wait):
+            raise ValueError(
+                f"Capacity exceeded for {pipeline_type} pipeline "
+                f"({self.capacity} streams/second)"
+            )
+
     def process_through_pipeline(self, pipeline_type: str, data: Any) -> str:
-        """Process data through a pipeline."""
-        pipeline = self.create_pipeline(pipeline_type, f"{pipeline_type}_pipeline")
-        return pipeline.process(data)
+        """Process data through a pooled pipeline."""
+        self._admit(pipeline_type)
+        pipeline = self.pool.acquire(pipeline_type)
+        try:
+            return pipeline.process(data)
+        finally:
+            self.pool.release(pipeline_type, pipeline)
+
+    def chain_pipelines(
+        self, num_pipelines: int = 3, num_records: int = 100, workers: int = 1
+    ) -> str:
+        """Chain multiple pipelines together and measure the run."""
+        kinds = ["json", "csv", "stream"]
+        chain = PipelineChain([kinds[i % len(kinds)] for i in range(num_pipelines)])
+        records = [{"id": i, "value": 20.0 + i % 10} for i in range(num_records)]
+        chain.run_parallel(records, workers)
+        metrics = chain.get_metrics()
+
+        return (
+            f"Chain result: {metrics['records']} records processed through "
+            f"{num_pipelines}-stage pipeline\n"
+            f"Performance: {metrics['efficiency']:.0f}% efficiency, "
+            f"{metrics['wall_s']:.4f}s total processing time "
+            f"({metrics['records_per_s']:.0f} records/s)"
+        )
+
+    def _run_isolated(
+        self,
+        pipeline_type: str,
+        records: Iterable[Any],
+        on_error: Callable[[Any, str, Exception], None],
+    ) -> List[Any]:
+        """Admit and run records one by one through a pooled pipeline.
+
+        Records are admitted in slices of at most one burst, one token
+        per record. The first slice obeys max_wait like any call; later
+        slices of an admitted batch wait for the buckets to refill, so a
+        large batch is throttled to the capacity instead of rejected.
+        """
+        items = iter(records)
+        size = self.admission.slice_size(pipeline_type)
+        batch = list(islice(items, size))
+        self._admit(pipeline_type, len(batch))
+        pipeline = self.pool.acquire(pipeline_type)
+        results: List[Any] = []
+        try:
+            while batch:
+                results.extend(pipeline.execute_isolated(batch, on_error))
+                batch = list(islice(items, size))
+                if batch:
+                    self._admit(pipeline_type, len(batch), max_wait=math.inf)
+        finally:
+            self.pool.release(pipeline_type, pipeline)
+        return results
+
+    def process_batch(self, pipeline_type: str, records: Iterable[Any]) -> str:
+        """Process records one by one; failures go to the dead-letter queue."""
+        failed = 0
+
+        def on_error(record: Any, stage: str, error: Exception) -> None:
+            nonlocal failed
+            failed += 1
+            self.dead_letters.push(pipeline_type, record, stage, error)
+
+        results = self._run_isolated(pipeline_type, records, on_error)
+        return f"Processed {len(results)} records, {failed} sent to dead-letter queue"
+
+    def replay_dead_letters(self) -> Dict[str, int]:
+        """Re-feed every replayable dead-lettered record through its pipeline.
 
-    def chain_pipelines(self, num_pipelines: int = 3, num_records: int = 100) -> str:
-        """Chain multiple pipelines together."""
-        # Simulate pipeline chaining with fixed timing
-        data = num_records
-        for i in range(num_pipelines):
-            data = data  # Data flows through
+        Entries leave the queue only once their replay succeeded: records
+        failing again are re-queued with the new error, and a batch whose
+        pipeline cannot run (unknown type, admission rejected) is kept.
+        """
+        entries = self.dead_letters.peek()
+        remaining = [entry for entry in entries if not entry.get("replayable", True)]
+        by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            if entry.get("replayable", True):
+                by_type.setdefault(entry["pipeline"], []).append(entry)
+        replayed = len(entries) - len(remaining)
+        try:
+            while by_type:
+                pipeline_type, batch = next(iter(by_type.items()))
 
-        elapsed = 0.2  # Fixed processing time for consistent output
-        efficiency = 95  # Simulated efficiency
+                def on_error(record: Any, stage: str, error: Exception) -> None:
+                    remaining.append(
+                        DeadLetterQueue.make_entry(pipeline_type, record, stage, error)
+                    )
 
-        return f"Chain result: {num_records} records processed through {num_pipelines}-stage pipeline\nPerformance: {efficiency}% efficiency, {elapsed}s total processing time"
+                try:
+                    self._run_isolated(
+                        pipeline_type, [entry["record"] for entry in batch], on_error
+                    )
+                except ValueError:
+                    remaining.extend(batch)
+                del by_type[pipeline_type]
+        finally:
+            for batch in by_type.values():
+                remaining.extend(batch)
+            self.dead_letters.replace(remaining)
+        failed = len(self.dead_letters)
+        return {
+            "replayed": replayed,
+            "recovered": len(entries) - failed,
+            "failed": failed,
+        }
 
     def recover_from_error(self) -> str:
-        """Demonstrate error recovery mechanism."""
-        return "Recovery successful: Pipeline restored, processing resumed"
+        """Replay the dead-letter queue and report the outcome."""
+        if not len(self.dead_letters):
+            return "Recovery successful: Pipeline restored, processing resumed"
+        outcome = self.replay_dead_letters()
+        return (
+            f"Recovery: {outcome['recovered']}/{outcome['replayed']} records "
+            f"replayed, {outcome['failed']} still in dead-letter queue"
+        )
 
 
 def main() -> None:
@@ -265,5 +1317,48 @@ def main() -> None:
     print("Nexus Integration complete. All systems operational.")
 
 
+def benchmark(size: int = 200_000) -> None:
+    """Compare memory of dict wrappers with Record envelopes."""
+    print(f"=== Stage envelope memory benchmark ({size} records) ===")
+    records = [{"id": i} for i in range(size)]
+
+    # the wrappers the stages used to build around every record
+    legacy: List[Callable[[Any], Any]] = [
+        lambda data: {"validated": True, "data": data},
+        lambda data: data.update(enriched=True, timestamp=time.time_ns()) or data,
+        lambda data: {"formatted": True, "output": data},
+    ]
+    tracemalloc.start()
+    start = time.perf_counter()
+    wrapped = []
+    for record in records:
+        for step in legacy:
+            record = step(record)
+        wrapped.append(record)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"dict wrappers: peak {peak / 2**20:.1f} MiB, {elapsed:.4f}s")
+    del wrapped
+
+    clock = CoarseClock()
+    stages = [InputStage(), TransformStage(clock), OutputStage()]
+    tracemalloc.start()
+    start = time.perf_counter()
+    enveloped = []
+    for record in records:
+        for stage in stages:
+            record = stage.process(record)
+        enveloped.append(record)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    clock.stop()
+    print(f"Record envelope: peak {peak / 2**20:.1f} MiB, {elapsed:.4f}s")
+
+
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        benchmark()
+    else:
+        main()